@@ -1,10 +1,11 @@
 from __future__ import annotations
 
-from typing import Dict
+from types import MappingProxyType
+from typing import Mapping
 
 # Very conservative base ampacity (A) for Cu THHN in conduit at 30C, single conductor
 # These are simplified values for demonstration; users must verify against local codes and specific installation conditions.
-BASE_AMPACITY_CU_THHN_30C: Dict[str, int] = {
+BASE_AMPACITY_CU_THHN_30C: Mapping[str, int] = MappingProxyType({
     "14": 20,
     "12": 25,
     "10": 35,
@@ -18,7 +19,7 @@ BASE_AMPACITY_CU_THHN_30C: Dict[str, int] = {
     "2/0": 175,
     "3/0": 200,
     "4/0": 230,
-}
+})
 
 
 def temp_correction_factor(ambient_c: float) -> float:
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
-from typing import List, Dict
+from types import MappingProxyType
+from typing import Mapping, Tuple
 
 
 # AWG areas in mm^2 (nominal) for sizes commonly used in power
-AWG_SIZES: List[str] = [
+# Read-only: these tables are shared by every session in the process
+AWG_SIZES: Tuple[str, ...] = (
     "14",
     "12",
     "10",
@@ -18,9 +20,9 @@ AWG_SIZES: List[str] = [
     "2/0",
     "3/0",
     "4/0",
-]
+)
 
-AWG_AREA_MM2: Dict[str, float] = {
+AWG_AREA_MM2: Mapping[str, float] = MappingProxyType({
     "14": 2.08,
     "12": 3.31,
     "10": 5.26,
@@ -34,8 +36,8 @@ AWG_AREA_MM2: Dict[str, float] = {
     "2/0": 67.43,
     "3/0": 85.01,
     "4/0": 107.2,
-}
+})
 
 
-def all_awg_sorted_small_to_large() -> List[str]:
+def all_awg_sorted_small_to_large() -> Tuple[str, ...]:
     return AWG_SIZES
@@ -4,7 +4,7 @@ from typing import Optional
 
 
 # Conservative mapping from OCPD rating (A) to minimum Cu grounding AWG (approximate)
-GROUND_CU_FOR_OCPD = [
+GROUND_CU_FOR_OCPD = (
     (20, "12"),
     (60, "10"),
     (100, "8"),
@@ -14,7 +14,7 @@ GROUND_CU_FOR_OCPD = [
     (600, "2"),
     (800, "1"),
     (1100, "1/0"),
-]
+)
 
 
 def recommend_ground_cu_awg(ocpd_a: Optional[float]) -> Optional[str]:
@@ -15,7 +15,7 @@ if _SRC not in sys.path:
 
 from solar.energy.devices import Device, DeviceList
 from solar.energy.calculator import compute_energy_summaries
-from state.persistence import load_devices, save_devices
+from state.persistence import add_devices, is_valid_namespace, load_devices, new_namespace, remove_device, save_devices
 from solar.cables.awg_table import AWG_SIZES, AWG_AREA_MM2
 from solar.cables.ampacity import BASE_AMPACITY_CU_THHN_30C, temp_correction_factor
 from solar.cables.sizing import resistivity_ohm_m
@@ -26,17 +26,29 @@ st.title("☀️ Solar Planner")
 st.caption("All-in-one: Consumption, Cable Sizing, and Parts List")
 
 
+def _namespace() -> str:
+	# Each workspace is keyed by a `?token=` URL parameter so browser sessions never share data
+	if "namespace" not in st.session_state:
+		token = st.experimental_get_query_params().get("token", [None])[0]
+		if not is_valid_namespace(token):
+			token = new_namespace()
+			st.experimental_set_query_params(token=token)
+		st.session_state.namespace = token
+	return st.session_state.namespace
+
+
 def _init_state():
 	if "devices" not in st.session_state:
 		try:
-			loaded = [Device(**d) for d in load_devices()]
+			loaded = [Device(**d) for d in load_devices(_namespace())]
 		except Exception:
 			loaded = []
 		st.session_state.devices = loaded
 
 
-def _persist():
-	save_devices([d.model_dump() for d in st.session_state.devices])
+def _sync(stored: list[dict]):
+	# Adopt the stored list so changes made by other sessions on the same token show up too
+	st.session_state.devices = [Device(**d) for d in stored]
 
 
 _init_state()
@@ -71,11 +83,11 @@ with tab1:
 						"count": int(row.get("count", 1)),
 					}
 					new_devices.append(Device(**norm))
+				new_json = [d.model_dump() for d in new_devices]
 				if import_mode == "Replace":
-					st.session_state.devices = new_devices
+					_sync(save_devices(_namespace(), new_json))
 				else:
-					st.session_state.devices.extend(new_devices)
-				_persist()
+					_sync(add_devices(_namespace(), new_json))
 				st.success(f"Imported {len(new_devices)} devices ({import_mode.lower()}).")
 				st.experimental_rerun()
 			except Exception as e:
@@ -90,8 +102,7 @@ with tab1:
 		if submitted:
 			try:
 				device = Device(name=name, power_w=power, duty_hours_per_day=duty, count=count)
-				st.session_state.devices.append(device)
-				_persist()
+				_sync(add_devices(_namespace(), [device.model_dump()]))
 				st.success(f"Added {device.name}")
 			except Exception as e:
 				st.error(f"Invalid input: {e}")
@@ -111,8 +122,7 @@ with tab1:
 
 			remove = cols[0].button("Remove", key=f"rm_{d.id}")
 			if remove:
-				st.session_state.devices = [x for x in st.session_state.devices if x.id != d.id]
-				_persist()
+				_sync(remove_device(_namespace(), d.id))
 				st.experimental_rerun()
 
 	device_list = DeviceList(devices=st.session_state.devices)
@@ -133,6 +143,7 @@ with tab1:
 			mime="application/json",
 		)
 	st.caption("NOTE: Click 'download devices.json' to save your device list if you don't want to lose it")
+	st.caption("Your device list is tied to this page's URL. Bookmark it to come back to the same workspace.")
 
 with tab2:
 	st.subheader("Cable Sizing")
@@ -1,39 +1,133 @@
 from __future__ import annotations
 
 import os
+import re
+import threading
+import weakref
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Iterator, Optional
+from uuid import uuid4
 from tinydb import TinyDB
 
 
-def _db_path() -> Path:
+# Namespaces come from a URL token and are the only access control on a workspace,
+# so only accept the unguessable shape minted by `new_namespace` (uuid4 hex)
+_NAMESPACE_RE = re.compile(r"[0-9a-f]{32}")
+
+
+class _RWLock:
+    """Many concurrent readers or one writer; a waiting writer blocks new readers."""
+
+    def __init__(self) -> None:
+        self._cond = threading.Condition()
+        self._readers = 0
+        self._writer = False
+        self._waiting_writers = 0
+
+    @contextmanager
+    def read(self) -> Iterator[None]:
+        with self._cond:
+            while self._writer or self._waiting_writers:
+                self._cond.wait()
+            self._readers += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._readers -= 1
+                if not self._readers:
+                    self._cond.notify_all()
+
+    @contextmanager
+    def write(self) -> Iterator[None]:
+        with self._cond:
+            self._waiting_writers += 1
+            while self._writer or self._readers:
+                self._cond.wait()
+            self._waiting_writers -= 1
+            self._writer = True
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._writer = False
+                self._cond.notify_all()
+
+
+# Weak values: a lock only lives while some operation on its namespace holds it
+_locks: "weakref.WeakValueDictionary[str, _RWLock]" = weakref.WeakValueDictionary()
+_locks_guard = threading.Lock()
+
+
+def _lock_for(namespace: str) -> _RWLock:
+    with _locks_guard:
+        lock = _locks.get(namespace)
+        if lock is None:
+            lock = _locks[namespace] = _RWLock()
+        return lock
+
+
+def is_valid_namespace(namespace: Optional[str]) -> bool:
+    # fullmatch: `$` with `match` would also accept a trailing newline
+    return isinstance(namespace, str) and _NAMESPACE_RE.fullmatch(namespace) is not None
+
+
+def new_namespace() -> str:
+    return uuid4().hex
+
+
+def _data_dir() -> Path:
     env_dir = os.environ.get("APP_DATA_DIR")
     if env_dir:
         data_dir = Path(env_dir)
     else:
         # Default to ./data when not configured
         data_dir = Path("./data")
-    data_dir.mkdir(parents=True, exist_ok=True)
-    return data_dir / "app.json"
+    return data_dir
+
+
+def _db_path(namespace: str) -> Path:
+    if not is_valid_namespace(namespace):
+        raise ValueError(f"Invalid namespace: {namespace!r}")
+    return _data_dir() / "sessions" / f"{namespace}.json"
+
 
+def get_db(namespace: str) -> TinyDB:
+    path = _db_path(namespace)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    return TinyDB(path)
 
-def get_db() -> TinyDB:
-    return TinyDB(_db_path())
 
+def _read_table(namespace: str, name: str) -> list[dict]:
+    path = _db_path(namespace)
+    with _lock_for(namespace).read():
+        # Read-only visitors never create a file for their namespace
+        if not path.exists():
+            return []
+        db = TinyDB(path, access_mode="r")
+        try:
+            return db.table(name).all()
+        finally:
+            db.close()
 
-def save_devices(devices_json: list[dict]) -> None:
-    db = get_db()
-    table = db.table("devices")
-    table.truncate()
-    table.insert({"devices": devices_json})
-    db.close()
 
+def _update_table(namespace: str, name: str, update: Callable[[list[dict]], dict]) -> dict:
+    # Read-modify-write under one write lock, so changes from other sessions
+    # sharing the namespace are applied on top of instead of overwritten
+    with _lock_for(namespace).write():
+        db = get_db(namespace)
+        try:
+            table = db.table(name)
+            row = update(table.all())
+            table.truncate()
+            table.insert(row)
+            return row
+        finally:
+            db.close()
 
-def load_devices() -> list[dict]:
-    db = get_db()
-    table = db.table("devices")
-    rows = table.all()
-    db.close()
+
+def _devices_of(rows: list[dict]) -> list[dict]:
     if rows:
         row = rows[0]
         if "devices" in row:
@@ -41,17 +135,35 @@ def load_devices() -> list[dict]:
     return []
 
 
-def save_settings(settings: dict) -> None:
-    db = get_db()
-    table = db.table("settings")
-    table.truncate()
-    table.insert({**settings})
-    db.close()
+def add_devices(namespace: str, devices_json: list[dict]) -> list[dict]:
+    """Append devices to the stored list and return the resulting list."""
+    row = _update_table(namespace, "devices", lambda rows: {"devices": _devices_of(rows) + devices_json})
+    return row["devices"]
+
+
+def remove_device(namespace: str, device_id: str) -> list[dict]:
+    """Drop the device with `device_id` from the stored list and return the resulting list."""
+    row = _update_table(
+        namespace, "devices",
+        lambda rows: {"devices": [d for d in _devices_of(rows) if d.get("id") != device_id]},
+    )
+    return row["devices"]
+
+
+def save_devices(namespace: str, devices_json: list[dict]) -> list[dict]:
+    """Replace the whole stored list, e.g. for an explicit "Replace" import."""
+    row = _update_table(namespace, "devices", lambda rows: {"devices": devices_json})
+    return row["devices"]
+
+
+def load_devices(namespace: str) -> list[dict]:
+    return _devices_of(_read_table(namespace, "devices"))
+
+
+def save_settings(namespace: str, settings: dict) -> None:
+    _update_table(namespace, "settings", lambda rows: {**settings})
 
 
-def load_settings() -> dict:
-    db = get_db()
-    table = db.table("settings")
-    rows = table.all()
-    db.close()
+def load_settings(namespace: str) -> dict:
+    rows = _read_table(namespace, "settings")
     return (rows[0] if rows else {})
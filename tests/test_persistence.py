@@ -0,0 +1,135 @@
+import os
+import sys
+import threading
+import uuid
+
+import pytest
+
+_APP = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "streamlit_app"))
+if _APP not in sys.path:
+    sys.path.insert(0, _APP)
+
+from state import persistence
+from state.persistence import (
+    add_devices, is_valid_namespace, load_devices, new_namespace, remove_device, save_devices,
+)
+
+
+@pytest.fixture(autouse=True)
+def _data_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("APP_DATA_DIR", str(tmp_path))
+
+
+def test_namespaces_are_isolated():
+    a, b = new_namespace(), new_namespace()
+    save_devices(a, [{"name": "Fridge"}])
+    save_devices(b, [{"name": "LED Bulb"}])
+    assert load_devices(a) == [{"name": "Fridge"}]
+    assert load_devices(b) == [{"name": "LED Bulb"}]
+    assert load_devices(new_namespace()) == []
+
+
+def test_rejects_path_like_namespaces():
+    assert not is_valid_namespace(None)
+    assert not is_valid_namespace("../../etc/passwd")
+    assert not is_valid_namespace("aaaaaaaa")
+    assert not is_valid_namespace(new_namespace() + "\n")
+    assert not is_valid_namespace(new_namespace().upper())
+    assert not is_valid_namespace(str(uuid.uuid4()))
+    assert not is_valid_namespace(12345678)
+    assert is_valid_namespace(new_namespace())
+    with pytest.raises(ValueError):
+        load_devices("../app")
+
+
+def test_sessions_sharing_a_namespace_keep_each_others_changes():
+    ns = new_namespace()
+    save_devices(ns, [{"id": "1", "name": "Lamp"}])
+    # Two tabs on the same token load before either saves
+    tab_a = load_devices(ns)
+    tab_b = load_devices(ns)
+    tab_a = add_devices(ns, [{"id": "2", "name": "Fridge"}])
+    tab_b = add_devices(ns, [{"id": "3", "name": "Pump"}])
+    assert [d["name"] for d in tab_b] == ["Lamp", "Fridge", "Pump"]
+    tab_a = remove_device(ns, "1")
+    assert [d["name"] for d in tab_a] == ["Fridge", "Pump"]
+    assert load_devices(ns) == tab_a
+
+
+def test_rwlock_admits_concurrent_readers():
+    lock = persistence._RWLock()
+    both_inside = threading.Barrier(2, timeout=2)
+    errors = []
+
+    def read():
+        with lock.read():
+            try:
+                both_inside.wait()
+            except threading.BrokenBarrierError as e:
+                errors.append(e)
+
+    readers = [threading.Thread(target=read) for _ in range(2)]
+    for t in readers:
+        t.start()
+    for t in readers:
+        t.join()
+    assert errors == []
+
+
+def test_rwlock_writer_waits_for_readers():
+    lock = persistence._RWLock()
+    reading = threading.Event()
+    release = threading.Event()
+    wrote = threading.Event()
+
+    def read():
+        with lock.read():
+            reading.set()
+            release.wait(2)
+
+    def write():
+        with lock.write():
+            wrote.set()
+
+    reader = threading.Thread(target=read)
+    reader.start()
+    assert reading.wait(2)
+    writer = threading.Thread(target=write)
+    writer.start()
+    assert not wrote.wait(0.1)
+    release.set()
+    assert wrote.wait(2)
+    reader.join()
+    writer.join()
+
+
+def test_locks_are_released_with_their_last_user():
+    ns = new_namespace()
+    save_devices(ns, [])
+    load_devices(new_namespace())
+    assert ns not in persistence._locks
+    assert len(persistence._locks) == 0
+
+
+def test_concurrent_writes_keep_file_consistent():
+    ns = new_namespace()
+    payloads = [[{"name": f"device-{i}", "count": j} for j in range(20)] for i in range(16)]
+    reads, errors = [], []
+
+    def read():
+        for _ in range(10):
+            try:
+                reads.append(load_devices(ns))
+            except Exception as e:
+                errors.append(e)
+
+    threads = [threading.Thread(target=save_devices, args=(ns, p)) for p in payloads]
+    readers = [threading.Thread(target=read) for _ in range(16)]
+    for t in threads + readers:
+        t.start()
+    for t in threads + readers:
+        t.join()
+    assert errors == []
+    assert len(reads) == 160
+    assert all(r == [] or r in payloads for r in reads)
+    assert load_devices(ns) in payloads